@@ -0,0 +1,126 @@
+# read_workbook replaces openpyxl's data_only reader, so on the same file it must
+# return what openpyxl returns; openpyxl is only needed to run this check
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from datetime import datetime
+
+import pandas as pd
+
+import track_progress as tp
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+NS = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+NS_R = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PKG_RELS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+CONTENT_TYPES = (
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>')
+ROOT_RELS = (
+    f'<Relationships xmlns="{PKG_RELS}">'
+    f'<Relationship Id="rId1" Type="{REL}/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>')
+BOOK_RELS = (
+    f'<Relationships xmlns="{PKG_RELS}">'
+    f'<Relationship Id="rId1" Type="{REL}/worksheet" Target="worksheets/sheet1.xml"/>'
+    f'<Relationship Id="rId2" Type="{REL}/styles" Target="styles.xml"/>'
+    '</Relationships>')
+# t="d" ISO dates, date-styled serials (style 1 in STYLES_XML), inlineStr
+# cells with and without an <is> child, a boolean and a plain number
+SHEET = (
+    f'<worksheet {NS}><sheetData>'
+    '<row r="1"><c r="A1" t="inlineStr"><is><t>Date</t></is></c>'
+    '<c r="B1" t="inlineStr"><is><t>Serial</t></is></c>'
+    '<c r="C1" t="inlineStr"><is><t>Note</t></is></c>'
+    '<c r="D1" t="inlineStr"><is><t>Flag</t></is></c></row>'
+    '<row r="2"><c r="A2" t="d"><v>2025-05-01T00:00:00</v></c><c r="B2" s="1"><v>45777</v></c>'
+    '<c r="C2" t="inlineStr"/><c r="D2" t="b"><v>1</v></c></row>'
+    '<row r="3"><c r="A3" t="d"><v>2025-05-02T12:30:00Z</v></c><c r="B3" s="1"><v>45778.5</v></c>'
+    '<c r="C3" t="inlineStr"><is><t>ok</t></is></c><c r="D3"><v>2.5</v></c></row>'
+    '</sheetData></worksheet>')
+
+
+def write_book(path, date1904):
+    pr = '<workbookPr date1904="1"/>' if date1904 else ''
+    book = (f'<workbook {NS} {NS_R}>{pr}<sheets>'
+            '<sheet name="S" sheetId="1" r:id="rId1"/></sheets></workbook>')
+    with zipfile.ZipFile(path, 'w') as zf:
+        zf.writestr('[Content_Types].xml', CONTENT_TYPES)
+        zf.writestr('_rels/.rels', ROOT_RELS)
+        zf.writestr('xl/workbook.xml', book)
+        zf.writestr('xl/_rels/workbook.xml.rels', BOOK_RELS)
+        zf.writestr('xl/styles.xml', tp.STYLES_XML)
+        zf.writestr('xl/worksheets/sheet1.xml', SHEET)
+
+
+def openpyxl_rows(path):
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        return {name: [list(r) for r in wb[name].values] for name in wb.sheetnames}
+    finally:
+        wb.close()
+
+
+def without_blank_rows(sheets):
+    # openpyxl pads every row to the sheet width; compare rows trimmed of trailing blanks
+    def trim(r):
+        while r and r[-1] is None:
+            r = r[:-1]
+        return r
+    return {name: [trim(r) for r in rows if any(v is not None for v in r)]
+            for name, rows in sheets.items()}
+
+
+@unittest.skipIf(openpyxl is None, 'openpyxl is not installed')
+class ReadWorkbookTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def assertSameAsOpenpyxl(self, path):
+        self.assertEqual(without_blank_rows(tp.read_workbook(path)),
+                         without_blank_rows(openpyxl_rows(path)))
+
+    def test_committed_tracker(self):
+        self.assertSameAsOpenpyxl(os.path.join(REPO, tp.FILE_PATH))
+
+    def test_iso_dates_and_empty_inline_strings(self):
+        path = os.path.join(self.tmp, 'book.xlsx')
+        write_book(path, date1904=False)
+        self.assertSameAsOpenpyxl(path)
+        self.assertIsNone(tp.read_workbook(path)['S'][1][2])
+
+    def test_date1904_epoch(self):
+        path = os.path.join(self.tmp, 'book1904.xlsx')
+        write_book(path, date1904=True)
+        self.assertSameAsOpenpyxl(path)
+        self.assertEqual(tp.read_workbook(path)['S'][1][1], datetime(2029, 5, 1))  # 1462 days after the 1900 reading
+
+    def test_sheet_frame_headers_match_read_excel(self):
+        path = os.path.join(self.tmp, 'headers.xlsx')
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(['A', None, 'A', 'A.1', 'A', 5, 5])
+        ws.append([1, 2, 3, 4, 5, 6, 7, None, 9])
+        wb.save(path)
+        frame = tp.sheet_frame(tp.read_workbook(path)[ws.title])
+        self.assertEqual(list(frame.columns), list(pd.read_excel(path, engine='openpyxl').columns))
+
+
+if __name__ == '__main__':
+    unittest.main()
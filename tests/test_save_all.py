@@ -0,0 +1,96 @@
+# Row-prefix reuse: save_all copies the unchanged leading rows' XML from the
+# workbook on disk, so every patched save must match a full rewrite byte for byte
+import datetime as dt
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from contextlib import redirect_stdout
+
+import track_progress as tp
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class FakeDate(dt.date):
+    day = dt.date(2025, 5, 1)
+
+    @classmethod
+    def today(cls):
+        return cls.day
+
+
+def archive():
+    with zipfile.ZipFile(tp.FILE_PATH) as zf:
+        return {n: zf.read(n) for n in zf.namelist()}
+
+
+class SaveAllTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        shutil.copy(os.path.join(REPO, tp.FILE_PATH), tmp)
+        os.chdir(tmp)
+        self.real_date, tp.date = tp.date, FakeDate
+
+    def tearDown(self):
+        tp.date = self.real_date
+        os.chdir(self.cwd)
+
+    def run_day(self, day, answers):
+        FakeDate.day = day
+        out = io.StringIO()
+        with redirect_stdout(out):
+            tp.main(['--batch', answers])
+        return out.getvalue()
+
+    def save(self, frames, before=None):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            tp.save_all(*frames, before)
+        return out.getvalue()
+
+    def test_patched_save_matches_full_rewrite(self):
+        days = [(dt.date(2025, 5, 1), 'yynnynyyyny'),
+                (dt.date(2025, 5, 1), 'nnnnnnnnnnn'),
+                (dt.date(2025, 5, 2), 'ynynynynyny'),
+                (dt.date(2025, 5, 3), 'yyyyyyyyyyy'),
+                (dt.date(2025, 6, 1), 'nyyyyyyyyyy'),
+                (dt.date(2025, 8, 1), 'ynnnnnnnnnn')]
+        for day, answers in days:
+            with self.subTest(day=day, answers=answers):
+                self.run_day(day, answers)
+                patched = archive()
+                self.save(tp.load_sheets())
+                self.assertEqual(patched, archive())
+
+    def test_same_day_rerun_skips_write(self):
+        self.run_day(dt.date(2025, 5, 1), 'yynnynyyyny')
+        self.assertIn('No changes', self.run_day(dt.date(2025, 5, 1), 'yynnynyyyny'))
+
+    def test_type_only_change_is_written(self):
+        self.run_day(dt.date(2025, 5, 1), 'yynnynyyyny')
+        frames = tp.load_sheets()
+        sum_df = frames[2]
+        sum_df['Completed'] = sum_df['Completed'].astype(object)
+        before = [tp.fingerprint(df) for df in frames]
+        # 7 and '7' hash alike by value alone; only the Python type differs
+        self.assertEqual(sum_df.at[0, 'Completed'], 7)
+        sum_df.at[0, 'Completed'] = '7'
+        self.assertIn('All sheets updated', self.save(frames, before))
+        self.assertEqual(tp.load_sheets()[2].at[0, 'Completed'], '7')
+
+    def test_header_change_on_empty_sheet_is_written(self):
+        frames = tp.load_sheets()
+        before = [tp.fingerprint(df) for df in frames]
+        self.assertEqual(len(frames[2]), 0)
+        frames[2].rename(columns={'Total': 'Blocks'}, inplace=True)
+        self.assertIn('All sheets updated', self.save(frames, before))
+        self.assertIn('Blocks', tp.load_sheets()[2].columns)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
+import numpy as np
 import pandas as pd
-from datetime import date
-import os, re, math
+from datetime import date, datetime, timedelta
+from xml.sax.saxutils import escape, quoteattr
+import xml.etree.ElementTree as ET
+import argparse, numbers, os, posixpath, re, math, zipfile
 
 # ───── CONFIGURATION ────────────────────────────────────────────────────────────
 FILE_PATH       = 'sprint_tracker.xlsx'
@@ -12,6 +15,7 @@ SHEET_LOG       = 'Daily Log'
 SHEET_SUM       = 'Daily Summary'
 SHEET_MONTHLY   = 'Monthly OKRs'
 SHEET_QUARTERLY = 'Quarterly OKRs'
+SHEETS          = [SHEET_PROGRESS, SHEET_LOG, SHEET_SUM, SHEET_MONTHLY, SHEET_QUARTERLY]
 
 # When did Month 1 start? (e.g. April=4)
 START_MONTH = 4
@@ -30,6 +34,7 @@ BLOCKS = {
     'Block 10': 'Family & Fun',
     'Block 11': 'D2 – Dialogue practice',
 }
+BLOCK_COLS = list(BLOCKS)
 
 # ───── KR ↔ Block mapping ──────────────────────────────────────────────────────
 KR_MAPPING = {
@@ -63,50 +68,266 @@ KR_MAPPING = {
     'Hold 5 tutored conversations ≥10 min':  'Block 8',
 }
 
+# One alternation over every KR text; the named group that matched gives the block.
+KR_RE = re.compile('|'.join(f'(?P<g{i}>{re.escape(k)})' for i, k in enumerate(KR_MAPPING)))
+KR_GROUP_BLOCK = {f'g{i}': b for i, b in enumerate(KR_MAPPING.values())}
+
+# First number in a KR target, e.g. '200 words' -> 200
+NUM_RE = re.compile(r"\d+")
+
+# All 21 possible 20-cell progress bars, indexed by pct // 5
+BARS = ['█' * i + '░' * (20 - i) for i in range(21)]
+
+# ───── XLSX parts ──────────────────────────────────────────────────────────────
+# The workbook is read and written with zipfile + XML directly, no Excel library.
+# Everything save_all writes except the sheet data is static; cell style 1 is
+# the date format used for Date columns.
+NS_MAIN = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+NS_REL  = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+NS_PKG  = 'http://schemas.openxmlformats.org/package/2006/relationships'
+NS_CT   = 'http://schemas.openxmlformats.org/package/2006/content-types'
+XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+CONTENT_TYPES_XML = (
+    f'{XML_DECL}<Types xmlns="{NS_CT}">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    + ''.join(f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+              'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+              for i in range(1, len(SHEETS) + 1))
+    + '</Types>')
+
+ROOT_RELS_XML = (
+    f'{XML_DECL}<Relationships xmlns="{NS_PKG}">'
+    f'<Relationship Id="rId1" Type="{NS_REL}/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>')
+
+WORKBOOK_XML = (
+    f'{XML_DECL}<workbook xmlns="{NS_MAIN}" xmlns:r="{NS_REL}"><sheets>'
+    + ''.join(f'<sheet name={quoteattr(name)} sheetId="{i}" r:id="rId{i}"/>'
+              for i, name in enumerate(SHEETS, start=1))
+    + '</sheets></workbook>')
+
+WORKBOOK_RELS_XML = (
+    f'{XML_DECL}<Relationships xmlns="{NS_PKG}">'
+    + ''.join(f'<Relationship Id="rId{i}" Type="{NS_REL}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+              for i in range(1, len(SHEETS) + 1))
+    + f'<Relationship Id="rId{len(SHEETS) + 1}" Type="{NS_REL}/styles" Target="styles.xml"/>'
+    '</Relationships>')
+
+STYLES_XML = (
+    f'{XML_DECL}<styleSheet xmlns="{NS_MAIN}">'
+    '<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy-mm-dd"/></numFmts>'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>')
+
+SHEET_HEAD = f'{XML_DECL}<worksheet xmlns="{NS_MAIN}"><sheetData>'.encode()
+SHEET_TAIL = b'</sheetData></worksheet>'
+EXCEL_EPOCH = datetime(1899, 12, 30)
+EXCEL_EPOCH_1904 = datetime(1904, 1, 1)
+
+# Number formats that mark a numeric cell as a date when reading
+BUILTIN_DATE_FMTS = {14, 15, 16, 17, 18, 19, 20, 21, 22, 45, 46, 47}
+DATE_CODE_RE = re.compile(r'[dmyhs]', re.I)
+FMT_LITERAL_RE = re.compile(r'"[^"]*"|\[[^\]]*\]|\\.')
+
 # ───── Helpers ─────────────────────────────────────────────────────────────────
 
+def _q(tag):
+    return f'{{{NS_MAIN}}}{tag}'
+
+
+def date_styles(zf, part):
+    # Indexes into cellXfs whose number format is a date/time format
+    if part is None or part not in zf.namelist():
+        return set()
+    root = ET.fromstring(zf.read(part))
+    custom = {int(f.get('numFmtId')): f.get('formatCode', '') for f in root.iter(_q('numFmt'))}
+    xfs = root.find(_q('cellXfs'))
+    found = set()
+    for i, xf in enumerate(xfs if xfs is not None else ()):
+        fmt = int(xf.get('numFmtId', 0))
+        if fmt in BUILTIN_DATE_FMTS or (fmt in custom and DATE_CODE_RE.search(FMT_LITERAL_RE.sub('', custom[fmt]))):
+            found.add(i)
+    return found
+
+
+def column_index(ref):
+    n = 0
+    for ch in ref:
+        if not ch.isalpha():
+            break
+        n = n * 26 + ord(ch.upper()) - 64
+    return n - 1
+
+
+def part_rels(zf, part):
+    # {relationship id: (type, part path)} for a package part
+    folder, name = posixpath.split(part)
+    rels_part = posixpath.join(folder, '_rels', f'{name}.rels')
+    if rels_part not in zf.namelist():
+        return {}
+    rels = {}
+    for r in ET.fromstring(zf.read(rels_part)):
+        target = r.get('Target', '')
+        path = target[1:] if target.startswith('/') else posixpath.normpath(posixpath.join(folder, target))
+        rels[r.get('Id')] = (r.get('Type', ''), path)
+    return rels
+
+
+def item_text(el):
+    # Plain <t> or rich-text runs; phonetic <rPh> hints are not part of the value
+    t = el.find(_q('t'))
+    if t is not None:
+        return t.text or ''
+    return ''.join(r.findtext(_q('t')) or '' for r in el.findall(_q('r')))
+
+
+def read_workbook(path):
+    # {sheet name: list of row value lists}, cell types decoded the way
+    # openpyxl's data_only reader would
+    with zipfile.ZipFile(path) as zf:
+        book = next(p for t, p in part_rels(zf, '').values() if t.endswith('/officeDocument'))
+        rels = part_rels(zf, book)
+        by_type = {t.rsplit('/', 1)[-1]: p for t, p in rels.values()}
+        shared = []
+        if by_type.get('sharedStrings') in zf.namelist():
+            shared = [item_text(si) for si in ET.fromstring(zf.read(by_type['sharedStrings'])).iter(_q('si'))]
+        dates = date_styles(zf, by_type.get('styles'))
+        root = ET.fromstring(zf.read(book))
+        pr = root.find(_q('workbookPr'))
+        date1904 = pr is not None and pr.get('date1904', '0').lower() in ('1', 'true')
+        epoch = EXCEL_EPOCH_1904 if date1904 else EXCEL_EPOCH
+        sheets = {}
+        for sh in root.iter(_q('sheet')):
+            part = rels[sh.get(f'{{{NS_REL}}}id')][1]
+            rows = []
+            for row in ET.fromstring(zf.read(part)).iter(_q('row')):
+                values = []
+                for c in row.iter(_q('c')):
+                    ref = c.get('r')
+                    col = column_index(ref) if ref else len(values)
+                    values.extend([None] * (col - len(values)))
+                    t, v = c.get('t', 'n'), c.findtext(_q('v'))
+                    if t == 'inlineStr':
+                        is_ = c.find(_q('is'))
+                        val = None if is_ is None else item_text(is_)
+                    elif v is None:
+                        val = None
+                    elif t == 's':
+                        val = shared[int(v)]
+                    elif t == 'b':
+                        val = v == '1'
+                    elif t in ('str', 'e'):
+                        val = v
+                    elif t == 'd':
+                        val = datetime.fromisoformat(v.rstrip('Z'))
+                    elif int(c.get('s', 0)) in dates:
+                        # Whole days plus the time of day rounded to the millisecond
+                        day, fraction = divmod(float(v), 1)
+                        val = epoch + timedelta(days=day, milliseconds=round(fraction * 86400000))
+                    elif '.' in v or 'E' in v or 'e' in v:
+                        val = float(v)
+                    else:
+                        val = int(v)
+                    values.append(val)
+                rows.append(values)
+            sheets[sh.get('name')] = rows
+    return sheets
+
+
+def frame_columns(header):
+    # Column names as read_excel gives them: a blank header cell becomes
+    # 'Unnamed: n' and a repeated name gets the first free '.1', '.2', ... suffix
+    names = [f'Unnamed: {i}' if h is None else h for i, h in enumerate(header)]
+    counts = {}
+    for i in sorted(range(len(names)), key=lambda i: header[i] is None):
+        col = base = names[i]
+        n = counts.get(col, 0)
+        while n:
+            counts[base] = n + 1
+            col = f'{base}.{n}'
+            n = n + 1 if col in names else counts.get(col, 0)
+        names[i] = col
+        counts[col] = n + 1
+    return names
+
+
+def sheet_frame(rows):
+    # Header row + data rows in one DataFrame build, as wide as the widest row.
+    # Unlike read_excel, blank rows are dropped rather than kept as NaN rows.
+    rows = [r for r in rows if any(v is not None for v in r)]
+    if not rows:
+        return pd.DataFrame()
+    width = max(max(i for i, v in enumerate(r) if v is not None) + 1 for r in rows)
+    rows = [(r + [None] * width)[:width] for r in rows]
+    return pd.DataFrame(rows[1:], columns=frame_columns(rows[0]))
+
+
 def load_sheets():
     if not os.path.exists(FILE_PATH):
         raise FileNotFoundError(f"{FILE_PATH} not found")
-    xls = pd.ExcelFile(FILE_PATH)
+    sheets = read_workbook(FILE_PATH)
     # Progress sheet
-    if SHEET_PROGRESS in xls.sheet_names:
-        prog_df = pd.read_excel(FILE_PATH, sheet_name=SHEET_PROGRESS)
-        expected = ['Date'] + list(BLOCKS.keys())
+    if SHEET_PROGRESS in sheets:
+        prog_df = sheet_frame(sheets[SHEET_PROGRESS])
+        expected = ['Date'] + BLOCK_COLS
         if not all(col in prog_df.columns for col in expected):
             prog_df = pd.DataFrame(columns=expected)
     else:
-        prog_df = pd.DataFrame(columns=['Date'] + list(BLOCKS.keys()))
+        prog_df = pd.DataFrame(columns=['Date'] + BLOCK_COLS)
     # Other sheets
-    log_df = pd.read_excel(FILE_PATH, sheet_name=SHEET_LOG)
-    sum_df = pd.read_excel(FILE_PATH, sheet_name=SHEET_SUM)
-    mon_df = pd.read_excel(FILE_PATH, sheet_name=SHEET_MONTHLY)
-    qtr_df = pd.read_excel(FILE_PATH, sheet_name=SHEET_QUARTERLY)
+    log_df = sheet_frame(sheets[SHEET_LOG])
+    sum_df = sheet_frame(sheets[SHEET_SUM])
+    mon_df = sheet_frame(sheets[SHEET_MONTHLY])
+    qtr_df = sheet_frame(sheets[SHEET_QUARTERLY])
+    # Keep Date typed so lookups compare datetime64 values, not strings
+    prog_df['Date'] = pd.to_datetime(prog_df['Date'])
+    # Block completion is held as int8 0/1; the ✔ marks only exist on disk
+    prog_df[BLOCK_COLS] = (prog_df[BLOCK_COLS] == '✔').astype(np.int8)
+    sum_df['Date']  = pd.to_datetime(sum_df['Date'])
     return prog_df, log_df, sum_df, mon_df, qtr_df
 
 
-def prompt_progress(prog_df):
-    today = date.today().strftime('%Y-%m-%d')
-    if today in prog_df['Date'].astype(str).values:
-        idx = prog_df.index[prog_df['Date'].astype(str) == today][0]
+def prompt_progress(prog_df, answers=None):
+    today = pd.Timestamp(date.today())
+    print(f"\nTracking progress for {today:%Y-%m-%d}\n" + "-"*30)
+    if answers is None:
+        answers = (input(f"✔ Did you complete {b} ({desc})? [y/N] ").strip().lower()
+                   for b, desc in BLOCKS.items())
+    row = {'Date': today}
+    for b, ans in zip(BLOCK_COLS, answers):
+        row[b] = np.int8(ans == 'y')
+    # Today's row exists: only its block cells change, so any extra columns survive.
+    # Otherwise enlarge in place with the whole row in one go.
+    mask = prog_df['Date'] == today
+    if mask.any():
+        prog_df.loc[mask.idxmax(), BLOCK_COLS] = [row.get(b) for b in BLOCK_COLS]
     else:
-        blank = {'Date': today, **{b: '' for b in BLOCKS}}
-        prog_df = pd.concat([prog_df, pd.DataFrame([blank])], ignore_index=True)
-        idx = prog_df.index[-1]
-    print(f"\nTracking progress for {today}\n" + "-"*30)
-    for b, desc in BLOCKS.items():
-        ans = input(f"✔ Did you complete {b} ({desc})? [y/N] ").strip().lower()
-        prog_df.at[idx, b] = '✔' if ans == 'y' else ''
+        prog_df.loc[len(prog_df)] = [row.get(c) for c in prog_df.columns]
     return prog_df
 
 
 def update_daily_log(prog_df, log_df):
     template = log_df.loc[log_df['Date'] == log_df['Date'].min()].copy()
-    today = date.today()
-    template['Date'] = pd.to_datetime(today)
-    done_blocks = set(prog_df.loc[prog_df['Date'] == today.strftime('%Y-%m-%d'), BLOCKS.keys()].stack()[lambda x: x == '✔'].index.get_level_values(1))
-    template['Done'] = template['Block'].fillna('').isin(done_blocks)
-    log_df = log_df[log_df['Date'] != template['Date'].iloc[0]]
+    today = pd.Timestamp(date.today())
+    template['Date'] = today
+    mask = prog_df['Date'] == today
+    done_blocks = set()
+    if mask.any():
+        today_row = prog_df.loc[mask.idxmax(), BLOCK_COLS]
+        done_blocks = set(today_row.index[today_row.to_numpy() == 1])
+    template['Done'] = template['Block'].isin(done_blocks)
+    log_df = log_df[log_df['Date'] != today]
     return pd.concat([log_df, template], ignore_index=True)
 
 
@@ -114,43 +335,62 @@ def update_daily_summary(prog_df, sum_df):
     if prog_df.empty:
         return sum_df
     last = prog_df.iloc[-1]
-    today_str = last['Date']
-    done = sum(1 for b in BLOCKS if last.get(b) == '✔')
-    total = len(BLOCKS)
+    today = last['Date']
+    done = int((last[BLOCK_COLS].to_numpy() == 1).sum())
+    total = len(BLOCK_COLS)
     pct   = int(round(done / total * 100)) if total else 0
-    bar   = '█' * (pct // 5) + '░' * (20 - pct // 5)
-    temp = sum_df.copy()
-    temp['Date_str'] = temp['Date'].astype(str)
-    temp = temp[temp['Date_str'] != today_str]
-    temp = temp.drop(columns=['Date_str'], errors='ignore')
-    new_row = pd.DataFrame([{ 'Date':         today_str,
-                               'Total':        total,
-                               'Completed':    done,
-                               'Progress (%)': f"{pct}%",
-                               'Progress Bar': bar }])
-    return pd.concat([temp, new_row], ignore_index=True)
+    bar   = BARS[min(pct // 5, 20)]
+    new_row = { 'Date':         today,
+                'Total':        total,
+                'Completed':    done,
+                'Progress (%)': f"{pct}%",
+                'Progress Bar': bar }
+    # Overwrite today's row if present, else append it in place
+    mask = sum_df['Date'] == today
+    idx = mask.idxmax() if mask.any() else len(sum_df)
+    sum_df.loc[idx] = [new_row.get(c) for c in sum_df.columns]
+    return sum_df
+
+
+def kr_block(kr):
+    m = KR_RE.search(str(kr))
+    return KR_GROUP_BLOCK[m.lastgroup] if m else None
+
+
+def block_counts(prog_df, period, current):
+    # One grouped pass over prog_df: completed days per block for each period.
+    flags = prog_df[BLOCK_COLS]
+    counts = flags.groupby(period.to_numpy()).sum()
+    if current not in counts.index:
+        return pd.Series(0, index=flags.columns)
+    return counts.loc[current]
 
 
 def update_monthly_okrs(prog_df, mon_df):
     today = date.today()
     mi = today.month - START_MONTH + 1
     label = f"Month {mi}"
-    for i, row in mon_df[mon_df['Month'] == label].iterrows():
-        kr = row['Key Result']
-        m = re.search(r"\d+", str(row['Target']))
+    month = prog_df['Date'].dt.month
+    counts = block_counts(prog_df, month, today.month)
+    c_kr, c_tgt = mon_df.columns.get_loc('Key Result'), mon_df.columns.get_loc('Target')
+    c_pct, c_bar = mon_df.columns.get_loc('Progress (%)'), mon_df.columns.get_loc('Progress Bar')
+    in_month = (mon_df['Month'] == label).to_numpy()
+    for i, vals in enumerate(mon_df.itertuples(index=False, name=None)):
+        if not in_month[i]:
+            continue
+        kr = vals[c_kr]
+        m = NUM_RE.search(str(vals[c_tgt]))
         if not m:
             continue
         tgt = int(m.group())
-        block = next((b for k, b in KR_MAPPING.items() if k in kr), None)
+        block = kr_block(kr)
         if not block:
             continue
-        df2 = prog_df.copy()
-        df2['Date'] = pd.to_datetime(df2['Date'])
-        done = df2[(df2['Date'].dt.month == today.month) & (df2[block] == '✔')].shape[0]
+        done = int(counts[block])
         pct = int(round(done / tgt * 100))
-        bar = '█' * (pct // 5) + '░' * (20 - pct // 5)
-        mon_df.at[i, 'Progress (%)'] = f"{pct}%"
-        mon_df.at[i, 'Progress Bar'] = bar
+        bar = BARS[min(pct // 5, 20)]
+        mon_df.iat[i, c_pct] = f"{pct}%"
+        mon_df.iat[i, c_bar] = bar
     return mon_df
 
 
@@ -158,44 +398,140 @@ def update_quarterly_okrs(prog_df, qtr_df):
     today = date.today()
     mi = today.month - START_MONTH + 1
     qtr = math.ceil(mi / 3)
-    months = list(range(START_MONTH + (qtr - 1) * 3, START_MONTH + qtr * 3))
-    for i, row in qtr_df.iterrows():
-        kr = row['Key Result']
-        m = re.search(r"\d+", str(row['Target']))
+    month = prog_df['Date'].dt.month
+    counts = block_counts(prog_df, (month - START_MONTH) // 3, qtr - 1)
+    c_kr, c_tgt = qtr_df.columns.get_loc('Key Result'), qtr_df.columns.get_loc('Target')
+    c_pct, c_bar = qtr_df.columns.get_loc('Progress (%)'), qtr_df.columns.get_loc('Progress Bar')
+    for i, vals in enumerate(qtr_df.itertuples(index=False, name=None)):
+        kr = vals[c_kr]
+        m = NUM_RE.search(str(vals[c_tgt]))
         if not m:
             continue
         tgt = int(m.group())
-        block = next((b for k, b in KR_MAPPING.items() if k in kr), None)
+        block = kr_block(kr)
         if not block:
             continue
-        df2 = prog_df.copy()
-        df2['Date'] = pd.to_datetime(df2['Date'])
-        done = df2[df2['Date'].dt.month.isin(months) & (df2[block] == '✔')].shape[0]
+        done = int(counts[block])
         pct = int(round(done / tgt * 100))
-        bar = '█' * (pct // 5) + '░' * (20 - pct // 5)
-        qtr_df.at[i, 'Progress (%)'] = f"{pct}%"
-        qtr_df.at[i, 'Progress Bar'] = bar
+        bar = BARS[min(pct // 5, 20)]
+        qtr_df.iat[i, c_pct] = f"{pct}%"
+        qtr_df.iat[i, c_bar] = bar
     return qtr_df
 
 
-def save_all(prog_df, log_df, sum_df, mon_df, qtr_df):
-    with pd.ExcelWriter(FILE_PATH, engine='openpyxl', mode='w') as writer:
-        prog_df.to_excel(writer, sheet_name=SHEET_PROGRESS, index=False)
-        log_df.to_excel(writer, sheet_name=SHEET_LOG, index=False)
-        sum_df.to_excel(writer, sheet_name=SHEET_SUM, index=False)
-        mon_df.to_excel(writer, sheet_name=SHEET_MONTHLY, index=False)
-        qtr_df.to_excel(writer, sheet_name=SHEET_QUARTERLY, index=False)
+def _xml_cell(v):
+    # '' is a blank cell, as with to_excel; NumPy scalars keep their cell type
+    if v is None or (isinstance(v, str) and not v):
+        return '<c/>'
+    if isinstance(v, (bool, np.bool_)):
+        return f'<c t="b"><v>{int(v)}</v></c>'
+    if isinstance(v, numbers.Integral):
+        return f'<c><v>{int(v)}</v></c>'
+    if isinstance(v, numbers.Real):
+        return f'<c><v>{float(v)}</v></c>'
+    if isinstance(v, datetime):
+        return f'<c s="1"><v>{(v - EXCEL_EPOCH).total_seconds() / 86400}</v></c>'
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{escape(str(v))}</t></is></c>'
+
+
+def _xml_row(r, values):
+    return f'<row r="{r}">{"".join(map(_xml_cell, values))}</row>'.encode()
+
+
+def fingerprint(df):
+    # Header, dtypes and one 64-bit hash per row; rows hash independently of
+    # each other. hash_pandas_object hashes object values by their string form
+    # (1, '1' and True collide), so their Python types are hashed in as well.
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    obj = df.loc[:, df.dtypes == object]
+    if len(obj.columns):
+        types = obj.apply(lambda col: col.map(lambda v: type(v).__name__))
+        hashes = hashes ^ pd.util.hash_pandas_object(types, index=False).to_numpy()
+    return tuple(df.columns), tuple(map(str, df.dtypes)), hashes
+
+
+def kept_rows(before, after):
+    # Number of leading data rows that are identical in both fingerprints
+    if before is None or before[:2] != after[:2]:
+        return 0
+    old, new = before[2], after[2]
+    n = min(len(old), len(new))
+    diff = np.flatnonzero(old[:n] != new[:n])
+    return int(diff[0]) if len(diff) else n
+
+
+def previous_sheets(row_counts):
+    # Sheet XML already on disk, reusable only if save_all wrote the file and
+    # its rows still line up one-to-one with the frame loaded from it
+    if not row_counts or not os.path.exists(FILE_PATH):
+        return {}
+    with zipfile.ZipFile(FILE_PATH) as zf:
+        if 'xl/workbook.xml' not in zf.namelist() or zf.read('xl/workbook.xml') != WORKBOOK_XML.encode():
+            return {}
+        sheets = {i: zf.read(f'xl/worksheets/sheet{i}.xml') for i in row_counts}
+    return {i: xml for i, xml in sheets.items() if xml.count(b'<row ') == row_counts[i] + 1}
+
+
+def sheet_prefix(xml, kept):
+    # Previously written sheet XML up to the first data row that changed
+    end = xml.find(b'<row r="%d">' % (kept + 2))
+    return xml[:end if end >= 0 else xml.rfind(SHEET_TAIL)]
+
+
+def save_all(prog_df, log_df, sum_df, mon_df, qtr_df, before=None):
+    frames = (prog_df, log_df, sum_df, mon_df, qtr_df)
+    after = [fingerprint(df) for df in frames]
+    before = before or [None] * len(frames)
+    kept = [kept_rows(b, a) for b, a in zip(before, after)]
+    if all(b is not None and b[:2] == a[:2] and k == len(a[2]) == len(b[2])
+           for k, a, b in zip(kept, after, before)):
+        print(f"\n✅ No changes to save in {FILE_PATH}")
+        return
+    # Only rows after the first change are serialized; the unchanged leading
+    # rows are patched in from the sheet XML already on disk
+    old = previous_sheets({i: len(b[2]) for i, (k, b) in enumerate(zip(kept, before), start=1) if k})
+    prog_disp = prog_df.copy()
+    prog_disp[BLOCK_COLS] = np.where(prog_df[BLOCK_COLS] == 1, '✔', '')
+    with zipfile.ZipFile(FILE_PATH, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', CONTENT_TYPES_XML)
+        zf.writestr('_rels/.rels', ROOT_RELS_XML)
+        zf.writestr('xl/workbook.xml', WORKBOOK_XML)
+        zf.writestr('xl/_rels/workbook.xml.rels', WORKBOOK_RELS_XML)
+        zf.writestr('xl/styles.xml', STYLES_XML)
+        for i, (df, k) in enumerate(zip((prog_disp,) + frames[1:], kept), start=1):
+            if i in old:
+                prefix = sheet_prefix(old[i], k)
+            else:
+                k, prefix = 0, SHEET_HEAD + _xml_row(1, df.columns)
+            rows = df.iloc[k:].astype(object).where(df.iloc[k:].notna(), None).itertuples(index=False, name=None)
+            with zf.open(f'xl/worksheets/sheet{i}.xml', 'w') as fh:
+                fh.write(prefix)
+                for r, row in enumerate(rows, start=k + 2):
+                    fh.write(_xml_row(r, row))
+                fh.write(SHEET_TAIL)
     print(f"\n✅ All sheets updated in {FILE_PATH}")
 
 
-def main():
-    prog_df, log_df, sum_df, mon_df, qtr_df = load_sheets()
-    prog_df = prompt_progress(prog_df)
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record today's block progress and refresh the sprint tracker.")
+    parser.add_argument('--batch', metavar='ANSWERS',
+                        help=f"one y/n per block in order ({len(BLOCKS)} letters, e.g. yynnynyyyny) instead of prompting")
+    args = parser.parse_args(argv)
+    answers = None
+    if args.batch is not None:
+        answers = args.batch.strip().lower()
+        if len(answers) != len(BLOCKS) or set(answers) - {'y', 'n'}:
+            parser.error(f"--batch needs exactly {len(BLOCKS)} y/n letters, got {args.batch!r}")
+
+    frames = load_sheets()
+    before = [fingerprint(df) for df in frames]
+    prog_df, log_df, sum_df, mon_df, qtr_df = frames
+    prog_df = prompt_progress(prog_df, answers)
     log_df  = update_daily_log(prog_df, log_df)
     sum_df  = update_daily_summary(prog_df, sum_df)
     mon_df  = update_monthly_okrs(prog_df, mon_df)
     qtr_df  = update_quarterly_okrs(prog_df, qtr_df)
-    save_all(prog_df, log_df, sum_df, mon_df, qtr_df)
+    save_all(prog_df, log_df, sum_df, mon_df, qtr_df, before)
 
 if __name__ == '__main__':
     main()